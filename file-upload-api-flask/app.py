@@ -1,69 +1,307 @@
 from flask import Flask, request, jsonify, send_file
+from flask.json.provider import JSONProvider
 from werkzeug.utils import secure_filename
+import orjson
+import errno
 import os
-import uuid
-from datetime import datetime
+import re
+import secrets
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider backed by orjson (much faster than stdlib json)
+    Keys keep insertion order (not sorted) unless sort_keys=True is passed
+    """
+    
+    def dumps(self, obj, sort_keys=False, default=None, **kwargs):
+        # Only the json.dumps options orjson can honour; fail loudly on the rest
+        if kwargs:
+            raise TypeError(f"ORJSONProvider.dumps() does not support: {', '.join(kwargs)}")
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, default=default, option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Same args handling as jsonify(): one arg → it, several → list, else kwargs
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        if len(args) == 1:
+            obj = args[0]
+        else:
+            obj = list(args) or kwargs or None
+        
+        # Pass orjson's bytes straight through (no str decode/re-encode)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 # ============================================
 # ✅ Configuration
 # ============================================
 app.config["UPLOAD_FOLDER"] = "uploads"
 app.config["MAX_FILE_SIZE"] = 5 * 1024 * 1024  # 5MB
+# ✅ Werkzeug rejects oversized bodies (413) while parsing, before buffering them
+# (+64KB headroom for the multipart envelope; exact per-file check after save)
+app.config["MAX_CONTENT_LENGTH"] = app.config["MAX_FILE_SIZE"] + 64 * 1024
+LARGE_UPLOAD_SIZE = 1 * 1024 * 1024  # 1MB - copied in-kernel when possible
+# In-progress uploads are written under this prefix, then linked into place
+UPLOAD_TEMP_PREFIX = '.part-'
+# copy_file_range errors that mean "not supported here" (e.g. tmpfs → ext4 is EXDEV)
+COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+# ✅ Behind nginx/Apache: let the proxy sendfile(2) downloads (USE_X_SENDFILE=1)
+app.config["USE_X_SENDFILE"] = os.environ.get("USE_X_SENDFILE") == "1"
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'pdf'}
 
 # ✅ Dangerous extensions - NEVER allow these!
 DANGEROUS_EXTENSIONS = {'exe', 'sh', 'bat', 'cmd', 'com', 'pif', 'scr', 'vbs', 'js'}
 
+# ✅ Allowed minus dangerous, precomputed → one lookup per check
+NET_ALLOWED = frozenset(ALLOWED_EXTENSIONS) - frozenset(DANGEROUS_EXTENSIONS)
+
 os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
 
+# ✅ Resolved once at startup (trailing separator blocks "uploads2" matching "uploads")
+UPLOAD_FOLDER_REAL = os.path.realpath(app.config["UPLOAD_FOLDER"]) + os.sep
+
+# ✅ Shared pool for per-file stats when scanning (stat releases the GIL)
+EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+# ✅ In-memory index: filename → (size_bytes, mtime)
+# Kept up to date by upload/delete; rescanned every INDEX_REFRESH_SECONDS
+# so other workers' uploads/deletes show up too
+FILE_INDEX = {}
+INDEX_LOCK = threading.Lock()      # guards FILE_INDEX / _index_changes
+REFRESH_LOCK = threading.Lock()    # one rescan at a time
+INDEX_REFRESH_SECONDS = int(os.environ.get("INDEX_REFRESH_SECONDS", 10))
+_index_scanned_at = 0.0
+_index_changes = None  # filename → entry (None = deleted) recorded during a rescan
+
+# Download MIME types by extension (no mimetypes.guess_type lookup)
+MIME_TYPES = {
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif',
+    'pdf': 'application/pdf'
+}
+
+# Headers that need Flask's conditional/Range handling on download
+CONDITIONAL_HEADERS = ('Range', 'If-Range', 'If-Modified-Since', 'If-None-Match')
+
+# ✅ Names that secure_filename would leave untouched (POSIX): only [A-Za-z0-9._-],
+# no leading/trailing '.' or '_' (secure_filename strips those)
+# fullmatch, not match + '$': '$' also matches before a trailing newline ("abc\n")
+# Fast path: ~300ns match vs. several µs for secure_filename
+_SAFE_NAME = re.compile(r'[A-Za-z0-9-](?:[A-Za-z0-9._-]{0,198}[A-Za-z0-9-])?').fullmatch
+
 # ============================================
 # Helper Functions
 # ============================================
+def split_extension(filename):
+    """
+    Split filename into (name, lowercase extension)
+    Example: photo.JPG → ('photo', 'jpg'), README → ('README', '')
+    """
+    i = filename.rfind('.')
+    if i < 0:
+        return filename, ''
+    return filename[:i], filename[i + 1:].lower()
+
 def allowed_file(filename):
     """Check if file extension is allowed"""
-    if '.' not in filename:
-        return False
+    # ✅ Security: Dangerous extensions are never in NET_ALLOWED
+    return split_extension(filename)[1] in NET_ALLOWED
+
+def generate_unique_filename(original_filename):
+    """
+    Generate unique filename to prevent conflicts
+    Format: token_originalname.ext
+    Example: a1b2c3d4_image.jpg
+    """
+    # Get name without extension + extension (one rfind, no list allocations)
+    name, ext = split_extension(original_filename)
+    
+    # Make it safe (most names already are → skip the rewrite)
+    safe_name = name if _SAFE_NAME(name) else secure_filename(name)
     
-    ext = filename.rsplit('.', 1)[1].lower()
+    # Generate unique ID (8 hex chars from one urandom read)
+    unique_id = secrets.token_hex(4)
     
-    # ✅ Security: Block dangerous extensions
-    if ext in DANGEROUS_EXTENSIONS:
-        return False
+    # Combine
+    unique_filename = f"{unique_id}_{safe_name}.{ext}"
     
-    return ext in ALLOWED_EXTENSIONS
+    return unique_filename
 
-def generate_unique_filename(original_filename):
+def open_temp_upload():
     """
-    Generate unique filename to prevent conflicts
-    Format: uuid_timestamp_originalname.ext
-    Example: a1b2c3d4_20241107_image.jpg
+    Create a hidden temp file in the upload folder for an in-progress upload
+    Temp names start with UPLOAD_TEMP_PREFIX → never indexed / listed
+    Returns (temppath, file object)
+    """
+    while True:
+        temppath = os.path.join(app.config["UPLOAD_FOLDER"], UPLOAD_TEMP_PREFIX + secrets.token_hex(8))
+        try:
+            return temppath, open(temppath, 'xb')
+        except FileExistsError:
+            continue  # Token collision - try another one
+
+def publish_upload(temppath, original_filename):
+    """
+    Move a finished upload into place under a unique name
+    os.link fails if the name exists → never overwrites; retries with a fresh token
+    Returns unique_filename
     """
-    # Get extension
-    ext = original_filename.rsplit('.', 1)[1].lower() if '.' in original_filename else ''
+    while True:
+        unique_filename = generate_unique_filename(original_filename)
+        filepath = os.path.join(app.config["UPLOAD_FOLDER"], unique_filename)
+        try:
+            os.link(temppath, filepath)
+        except FileExistsError:
+            continue  # Token collision - try another one
+        except Exception:
+            discard_file(temppath)
+            raise
+        
+        os.remove(temppath)
+        return unique_filename
+
+def discard_file(filepath):
+    """Remove a (partial / rejected) upload, ignoring already-missing files"""
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
     
-    # Get name without extension
-    name = original_filename.rsplit('.', 1)[0] if '.' in original_filename else original_filename
+    # Never leave it listed in /files
+    index_remove(os.path.basename(filepath))
+
+def save_upload(file, out):
+    """
+    Save uploaded file into already-open `out` and return its size in bytes
+    Large uploads Werkzeug already spooled to a temp file are copied
+    in-kernel (copy_file_range) instead of through Python buffers;
+    falls back to a regular save if that isn't supported or copies short
+    """
+    stream = file.stream
     
-    # Make it safe
-    safe_name = secure_filename(name)
+    # Spooled to disk → has a real fd (in-memory spools have no name)
+    if hasattr(os, 'copy_file_range') and getattr(stream, 'name', None) is not None:
+        stream.flush()
+        src = stream.fileno()
+        size = os.fstat(src).st_size
+        
+        if size > LARGE_UPLOAD_SIZE:
+            offset = 0
+            try:
+                while offset < size:
+                    copied = os.copy_file_range(src, out.fileno(), size - offset, offset)
+                    if copied == 0:
+                        break  # Short copy → fall back below
+                    offset += copied
+            except OSError as e:
+                if e.errno not in COPY_FALLBACK_ERRNOS:
+                    raise
+            
+            if offset == size:
+                return offset
+            
+            # Start over with a regular save
+            out.seek(0)
+            out.truncate()
+            stream.seek(0)
+    
+    # Small uploads (or fallback): regular save
+    file.save(out)
+    return out.tell()
+
+def _stat_entry(entry):
+    """Return (filename, size_bytes, mtime) for a directory entry (None if not a file)"""
+    # Skip if not a file, or an upload still being written
+    if entry.name.startswith(UPLOAD_TEMP_PREFIX) or not entry.is_file(follow_symlinks=False):
+        return None
     
-    # Generate unique ID
-    unique_id = str(uuid.uuid4())[:8]  # First 8 characters of UUID
+    # One stat per entry (cached by scandir where possible)
+    try:
+        st = entry.stat()
+    except FileNotFoundError:
+        return None  # Deleted while scanning
     
-    # Add timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return entry.name, st.st_size, st.st_mtime
+
+def index_set(filename, size, mtime):
+    """Record an upload in FILE_INDEX"""
+    with INDEX_LOCK:
+        FILE_INDEX[filename] = (size, mtime)
+        if _index_changes is not None:
+            _index_changes[filename] = (size, mtime)
+
+def index_remove(filename):
+    """Record a delete in FILE_INDEX"""
+    with INDEX_LOCK:
+        FILE_INDEX.pop(filename, None)
+        if _index_changes is not None:
+            _index_changes[filename] = None
+
+def refresh_index(max_age=None):
+    """
+    Rebuild FILE_INDEX from the uploads folder (one scandir pass)
+    max_age: only rescan if the index is older than this (seconds)
+    """
+    global _index_scanned_at, _index_changes
     
-    # Combine
-    unique_filename = f"{unique_id}_{timestamp}_{safe_name}.{ext}"
+    # One rescan at a time; threads that waited see a fresh index and skip
+    with REFRESH_LOCK:
+        if max_age is not None and time.monotonic() - _index_scanned_at <= max_age:
+            return
+        
+        # Uploads/deletes in this worker during the scan are replayed on top
+        with INDEX_LOCK:
+            _index_changes = {}
+        
+        try:
+            with os.scandir(app.config["UPLOAD_FOLDER"]) as it:
+                entries = list(it)
+            
+            # Stat entries in parallel (helps on cold caches / network disks)
+            index = {}
+            for result in EXECUTOR.map(_stat_entry, entries):
+                if result is not None:
+                    name, size, mtime = result
+                    index[name] = (size, mtime)
+            
+            with INDEX_LOCK:
+                for name, entry in _index_changes.items():
+                    if entry is None:
+                        index.pop(name, None)
+                    else:
+                        index[name] = entry
+                
+                FILE_INDEX.clear()
+                FILE_INDEX.update(index)
+                _index_scanned_at = time.monotonic()
+        finally:
+            with INDEX_LOCK:
+                _index_changes = None
+
+def index_snapshot():
+    """Get a copy of FILE_INDEX items, rescanning if it's stale"""
+    if time.monotonic() - _index_scanned_at > INDEX_REFRESH_SECONDS:
+        refresh_index(max_age=INDEX_REFRESH_SECONDS)
     
-    return unique_filename
+    with INDEX_LOCK:
+        return list(FILE_INDEX.items())
 
-def get_file_size_mb(filepath):
-    """Get file size in MB"""
-    size_bytes = os.path.getsize(filepath)
-    return round(size_bytes / (1024 * 1024), 2)
+# Build the index once at startup
+refresh_index()
 
 # ============================================
 # 1️⃣ Upload File (SECURE)
@@ -72,7 +310,7 @@ def get_file_size_mb(filepath):
 def upload():
     """
     Secure file upload with:
-    - File size check BEFORE upload
+    - File size limit enforced while parsing (MAX_CONTENT_LENGTH)
     - Unique filename generation
     - Dangerous extension blocking
     """
@@ -87,17 +325,6 @@ def upload():
     if file.filename == '':
         return jsonify({"error": "No file selected"}), 400
     
-    # ✅ Security: Check file size BEFORE saving
-    file.seek(0, os.SEEK_END)  # Move to end of file
-    file_size = file.tell()  # Get size
-    file.seek(0)  # Move back to start
-    
-    if file_size > app.config["MAX_FILE_SIZE"]:
-        max_mb = app.config["MAX_FILE_SIZE"] / (1024 * 1024)
-        return jsonify({
-            "error": f"File too large! Maximum {max_mb}MB allowed"
-        }), 413
-    
     # Check file type
     if not allowed_file(file.filename):
         return jsonify({
@@ -105,22 +332,93 @@ def upload():
             "allowed_types": list(ALLOWED_EXTENSIONS)
         }), 400
     
-    # ✅ Security: Generate UNIQUE filename
-    unique_filename = generate_unique_filename(file.filename)
+    # Save file to a hidden temp name first (rescans never see partial files)
+    temppath, out = open_temp_upload()
+    try:
+        with out:
+            file_size = save_upload(file, out)
+    except Exception:
+        # Don't leave a partial/empty file behind
+        discard_file(temppath)
+        raise
+    
+    # ✅ Security: Exact file size limit (MAX_CONTENT_LENGTH covers the whole body)
+    if file_size > app.config["MAX_FILE_SIZE"]:
+        discard_file(temppath)
+        return file_too_large(None)
+    
+    # ✅ Security: Publish under a UNIQUE filename (never overwrites)
+    unique_filename = publish_upload(temppath, file.filename)
     
-    # Save file
-    filepath = os.path.join(app.config["UPLOAD_FOLDER"], unique_filename)
-    file.save(filepath)
+    now = time.time()
+    index_set(unique_filename, file_size, now)
     
     # Get file info
-    file_size_mb = get_file_size_mb(filepath)
+    file_size_mb = round(file_size / (1024 * 1024), 2)
     
     return jsonify({
         "message": "✅ File uploaded successfully",
         "original_name": file.filename,
         "saved_as": unique_filename,
         "size_mb": file_size_mb,
-        "uploaded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "uploaded_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+        "download_url": f"/download/{unique_filename}"
+    }), 200
+
+
+# ============================================
+# 1️⃣b Upload File (STREAMING)
+# ============================================
+@app.route('/upload-stream', methods=['POST'])
+def upload_stream():
+    """
+    Raw-body upload without multipart parsing:
+    - Filename from ?filename= or X-Filename header
+    - Body streamed straight to disk in 64KB chunks
+    Example: curl --data-binary @image.jpg "http://localhost:5000/upload-stream?filename=image.jpg"
+    """
+    
+    original_filename = request.args.get('filename') or request.headers.get('X-Filename', '')
+    
+    # Check if filename is empty
+    if original_filename == '':
+        return jsonify({"error": "No filename provided"}), 400
+    
+    # Check file type
+    if not allowed_file(original_filename):
+        return jsonify({
+            "error": "File type not allowed",
+            "allowed_types": list(ALLOWED_EXTENSIONS)
+        }), 400
+    
+    # Stream body to a hidden temp name (MAX_CONTENT_LENGTH still applies → 413)
+    temppath, out = open_temp_upload()
+    try:
+        with out:
+            shutil.copyfileobj(request.stream, out, length=65536)
+            file_size = out.tell()
+    except Exception:
+        # Don't leave a partial file behind
+        discard_file(temppath)
+        raise
+    
+    # ✅ Security: Exact file size limit (MAX_CONTENT_LENGTH has headroom)
+    if file_size > app.config["MAX_FILE_SIZE"]:
+        discard_file(temppath)
+        return file_too_large(None)
+    
+    # ✅ Security: Publish under a UNIQUE filename (never overwrites)
+    unique_filename = publish_upload(temppath, original_filename)
+    
+    now = time.time()
+    index_set(unique_filename, file_size, now)
+    
+    return jsonify({
+        "message": "✅ File uploaded successfully",
+        "original_name": original_filename,
+        "saved_as": unique_filename,
+        "size_mb": round(file_size / (1024 * 1024), 2),
+        "uploaded_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
         "download_url": f"/download/{unique_filename}"
     }), 200
 
@@ -138,23 +436,45 @@ def download(filename):
     
     # ✅ Security: Prevent path traversal attacks
     # Example: /download/../../etc/passwd → blocked!
-    filename = secure_filename(filename)
+    filename = filename if _SAFE_NAME(filename) else secure_filename(filename)
     
-    filepath = os.path.join(app.config["UPLOAD_FOLDER"], filename)
+    # Absolute path → same file for open(), send_file (which would otherwise
+    # resolve relative paths against app.root_path, not the CWD) and os.remove
+    filepath = os.path.join(UPLOAD_FOLDER_REAL, filename)
     
     # ✅ Security: Check if file is actually in uploads folder
     # This prevents: /download/etc_passwd
     real_path = os.path.realpath(filepath)
-    upload_folder_real = os.path.realpath(app.config["UPLOAD_FOLDER"])
     
-    if not real_path.startswith(upload_folder_real):
+    if not real_path.startswith(UPLOAD_FOLDER_REAL):
         return jsonify({"error": "Access denied"}), 403
     
-    # Check if file exists
-    if not os.path.exists(filepath):
+    # Missing files surface as FileNotFoundError (no separate exists() stat)
+    try:
+        # X-Sendfile or Range/conditional requests need the path-based send
+        # conditional=True honours Range / If-Modified-Since (no re-sending)
+        if app.config["USE_X_SENDFILE"] or any(h in request.headers for h in CONDITIONAL_HEADERS):
+            return send_file(filepath, as_attachment=True, conditional=True)
+        
+        # One-shot download: stream the open file, skip stat/ETag/conditional work
+        f = open(filepath, 'rb')
+    except FileNotFoundError:
         return jsonify({"error": "File not found"}), 404
     
-    return send_file(filepath, as_attachment=True)
+    mimetype = MIME_TYPES.get(split_extension(filename)[1], 'application/octet-stream')
+    
+    response = send_file(
+        f,
+        mimetype=mimetype,
+        as_attachment=True,
+        download_name=filename,
+        conditional=False,
+        etag=False,
+        last_modified=None,
+        max_age=0
+    )
+    response.content_length = os.fstat(f.fileno()).st_size
+    return response
 
 
 # ============================================
@@ -167,38 +487,32 @@ def files():
     """
     
     try:
-        all_files = os.listdir(app.config["UPLOAD_FOLDER"])
+        entries = index_snapshot()
     except Exception as e:
         return jsonify({"error": "Cannot read files"}), 500
     
     files_list = []
-    total_size_mb = 0
+    total_bytes = 0
     
-    for filename in all_files:
-        filepath = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-        
-        # Skip if not a file
-        if not os.path.isfile(filepath):
-            continue
-        
-        file_size = os.path.getsize(filepath)
-        file_size_mb = round(file_size / (1024 * 1024), 2)
-        total_size_mb += file_size_mb
+    for filename, (file_size, upload_time) in entries:
+        total_bytes += file_size
         
         # Get upload date from file modification time
-        upload_time = os.path.getmtime(filepath)
-        upload_date = datetime.fromtimestamp(upload_time).strftime("%Y-%m-%d %H:%M:%S")
+        upload_date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(upload_time))
         
         files_list.append({
             "filename": filename,
-            "size_mb": file_size_mb,
+            "size_mb": round(file_size / (1024 * 1024), 2),
             "uploaded": upload_date,
             "download_url": f"/download/{filename}"
         })
     
+    # Sum raw bytes, round once (no per-file rounding error)
+    total_size_mb = round(total_bytes / (1024 * 1024), 2)
+    
     return jsonify({
         "total_files": len(files_list),
-        "total_size_mb": round(total_size_mb, 2),
+        "total_size_mb": total_size_mb,
         "files": files_list
     })
 
@@ -216,28 +530,30 @@ def delete(filename):
     """
     
     # ✅ Security: Prevent path traversal
-    filename = secure_filename(filename)
+    filename = filename if _SAFE_NAME(filename) else secure_filename(filename)
     
-    filepath = os.path.join(app.config["UPLOAD_FOLDER"], filename)
+    filepath = os.path.join(UPLOAD_FOLDER_REAL, filename)
     
     # ✅ Security: Check if file is in uploads folder
     real_path = os.path.realpath(filepath)
-    upload_folder_real = os.path.realpath(app.config["UPLOAD_FOLDER"])
     
-    if not real_path.startswith(upload_folder_real):
+    if not real_path.startswith(UPLOAD_FOLDER_REAL):
         return jsonify({"error": "Access denied"}), 403
     
-    # Check if file exists
-    if not os.path.exists(filepath):
-        return jsonify({"error": "File not found"}), 404
-    
-    # Delete file
+    # Delete file (missing → FileNotFoundError, no separate exists() stat)
     try:
         os.remove(filepath)
+        
+        index_remove(filename)
+        
         return jsonify({
             "message": "✅ File deleted successfully",
             "filename": filename
         }), 200
+    except FileNotFoundError:
+        # Drop stale index entry (e.g. deleted by another worker)
+        index_remove(filename)
+        return jsonify({"error": "File not found"}), 404
     except Exception as e:
         return jsonify({"error": "Failed to delete file"}), 500
 
@@ -249,8 +565,7 @@ def delete(filename):
 def info():
     """API information and statistics"""
     
-    total_files = len([f for f in os.listdir(app.config["UPLOAD_FOLDER"]) 
-                       if os.path.isfile(os.path.join(app.config["UPLOAD_FOLDER"], f))])
+    total_files = len(index_snapshot())
     
     return jsonify({
         "api_name": "Secure File Upload API",
@@ -259,7 +574,7 @@ def info():
             "Unique filename generation",
             "Path traversal protection",
             "Dangerous extension blocking",
-            "File size check before upload",
+            "File size limit enforced while parsing (MAX_CONTENT_LENGTH)",
             "Secure filename sanitization"
         ],
         "config": {
@@ -273,6 +588,7 @@ def info():
         },
         "endpoints": {
             "upload": "POST /upload",
+            "upload_stream": "POST /upload-stream?filename=<name>",
             "download": "GET /download/<filename>",
             "list": "GET /files",
             "delete": "DELETE /delete/<filename>",
@@ -302,23 +618,34 @@ def internal_error(e):
 # Run
 # ============================================
 if __name__ == '__main__':
-    print("\n" + "=" * 60)
-    print("🔒 SECURE File Upload API")
-    print("=" * 60)
-    print("\n✅ Security Features:")
-    print("   - Unique filename (prevents overwrite)")
-    print("   - Path traversal protection")
-    print("   - Dangerous extension blocking")
-    print("   - File size check BEFORE upload")
-    print("   - Secure filename sanitization")
-    print("\n⚙️  Configuration:")
-    print(f"   - Upload folder: {app.config['UPLOAD_FOLDER']}")
-    print(f"   - Max file size: {app.config['MAX_FILE_SIZE'] / (1024*1024)}MB")
-    print(f"   - Allowed: {', '.join(ALLOWED_EXTENSIONS)}")
-    print(f"   - Blocked: {', '.join(DANGEROUS_EXTENSIONS)}")
-    print("\n🌐 Running on: http://localhost:5000")
-    print("📊 System info: http://localhost:5000/info")
-    print("=" * 60)
-    print()
-    
+    # SHOW_BANNER=0 to skip; also skipped in the debug reloader's child process
+    if os.environ.get("SHOW_BANNER", "1") == "1" and os.environ.get("WERKZEUG_RUN_MAIN") != "true":
+        # One print → one stdout lock/flush instead of one per line
+        print("\n".join([
+            "",
+            "=" * 60,
+            "🔒 SECURE File Upload API",
+            "=" * 60,
+            "",
+            "✅ Security Features:",
+            "   - Unique filename (prevents overwrite)",
+            "   - Path traversal protection",
+            "   - Dangerous extension blocking",
+            "   - File size limit enforced while parsing (MAX_CONTENT_LENGTH)",
+            "   - Secure filename sanitization",
+            "",
+            "⚙️  Configuration:",
+            f"   - Upload folder: {app.config['UPLOAD_FOLDER']}",
+            f"   - Max file size: {app.config['MAX_FILE_SIZE'] / (1024*1024)}MB",
+            f"   - Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
+            f"   - Blocked: {', '.join(DANGEROUS_EXTENSIONS)}",
+            "",
+            "🌐 Running on: http://localhost:5000",
+            "📊 System info: http://localhost:5000/info",
+            "🚀 Production: gunicorn -c gunicorn.conf.py app:app",
+            "=" * 60,
+            ""
+        ]))
+    
+    # Dev server only - use gunicorn (gunicorn.conf.py) in production
     app.run(debug=True, port=5000)
\ No newline at end of file
@@ -0,0 +1,9 @@
+# ============================================
+# ASGI entry point (optional)
+# Run: hypercorn --worker-class uvloop asgi:asgi_app
+# ============================================
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app
+
+asgi_app = WsgiToAsgi(app)
@@ -0,0 +1,15 @@
+# ============================================
+# Gunicorn (production) config
+# Run: gunicorn -c gunicorn.conf.py app:app
+# ============================================
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+
+# ✅ Threaded workers - downloads/uploads no longer run one at a time
+worker_class = "gthread"
+workers = int(os.environ.get("WORKERS", 4))
+threads = int(os.environ.get("THREADS", 8))
+
+# Uploads can be slow clients; give them time
+timeout = 60